@@ -25,6 +25,12 @@ class Battery:
 
     Sign convention: positive power / current = charging, negative =
     discharging.
+
+    ``cell`` and ``circuit`` are read-only: the system-level limits and
+    ratings are scaled from them once at construction. For the same reason
+    the cell's property dataclasses (``cell.electrical``, ``cell.thermal``,
+    ``cell.format``) must not be modified after the battery is built —
+    construct a new ``Battery`` instead.
     """
 
     def __init__(
@@ -68,12 +74,28 @@ class Battery:
                     f"{type(cell).__name__} has no default degradation model. "
                     "Pass an explicit DegradationModel or use degradation=None."
                 )
-        self.cell = cell
-        self.circuit = circuit
+        self._cell = cell
+        self._circuit = circuit
+        (self._serial, self._parallel) = circuit
         self.soc_limits = soc_limits
         self.degradation = degradation
         self.derating = derating
         self.effective_cooling_area = effective_cooling_area
+
+        # system-level limits and ratings depend only on the cell and the circuit, which are
+        # read-only for the lifetime of the battery — scale them once here instead
+        # of on every property access in the step hot path
+        electrical = cell.electrical
+        self._min_voltage = electrical.min_voltage * self._serial
+        self._max_voltage = electrical.max_voltage * self._serial
+        self._max_charge_current = electrical.nominal_capacity * electrical.max_charge_rate * self._parallel
+        self._max_discharge_current = electrical.nominal_capacity * electrical.max_discharge_rate * self._parallel
+        self._nominal_capacity = electrical.nominal_capacity * self._parallel
+        self._nominal_voltage = electrical.nominal_voltage * self._serial
+        self._nominal_energy_capacity = self._nominal_capacity * self._nominal_voltage
+        self._thermal_capacity = cell.thermal.specific_heat * cell.thermal.mass * self._serial * self._parallel
+        self._surface_area = cell.format.area * self._serial * self._parallel  # total cell surface
+
         self.state = self.initialize_state(**initial_states)
 
     def initialize_state(
@@ -83,8 +105,8 @@ class Battery:
 
         Sets SOC, temperature, and SoH from the arguments, then evaluates
         OCV, hysteresis, Rint, and entropic coefficient at that initial
-        state so the returned object is consistent before the first
-        :meth:`step` call.
+        state — and the resulting rest voltage ``OCV + hys`` — so the
+        returned object is consistent before the first :meth:`step` call.
 
         Args:
             start_soc: Initial state of charge in p.u.
@@ -114,10 +136,11 @@ class Battery:
             i_max_charge=0.0,
             i_max_discharge=0.0,
         )
-        state.ocv = state.v = self.open_circuit_voltage(state)
+        state.ocv = self.open_circuit_voltage(state)
         state.hys = self.hysteresis_voltage(state)
         state.rint = self.internal_resistance(state)
         state.entropy = self.entropic_coefficient(state)
+        state.v = state.ocv + state.hys  # terminal voltage at rest (i = 0)
         return state
 
     def step(self, power_setpoint: float, dt: float) -> None:
@@ -173,7 +196,7 @@ class Battery:
 
         # update soc
         (soc_min, soc_max) = self.soc_limits
-        soc = state.soc + i * dt / Q / 3600
+        soc = state.soc + i * dt / (Q * 3600)  # Ah -> As folded into one division
         soc = max(soc_min, min(soc, soc_max))
 
         # check current direction, maintain previous state if in rest
@@ -201,13 +224,15 @@ class Battery:
         state.i_max_discharge = i_max_discharge
 
         if self.degradation is not None:
-            self.degradation.step(self.state, dt)  # updates state.soh_Q and state.soh_R
+            self.degradation.step(state, dt)  # updates state.soh_Q and state.soh_R
 
     def equilibrium_current(self, power_setpoint: float, ocv: float, hys: float, rint: float) -> float:
         """Solve the ECM for the current that meets a power setpoint.
 
         Solves the quadratic ``P = I × (OCV + hys + Rint × I)`` for ``I``
-        and returns the physically meaningful (positive-discriminant) root.
+        and returns the physically meaningful (positive-discriminant) root,
+        evaluated in the cancellation-free form ``2P / (OCV + √(OCV² + 4·Rint·P))``
+        (which reduces to ``P / OCV`` for ``rint == 0``).
 
         Args:
             power_setpoint: Target power in W.
@@ -222,7 +247,9 @@ class Battery:
         ocv = ocv + hys  # include hysteresis in equilibrium calculation
         if power_setpoint == 0.0:
             return 0.0
-        return -(ocv - math.sqrt(ocv**2 + 4 * rint * power_setpoint)) / (2 * rint)
+        # rationalised root of Rint·I² + OCV·I − P = 0: unlike (−OCV + √disc) / (2·Rint)
+        # it does not cancel when Rint·P ≪ OCV² and stays finite for Rint = 0
+        return 2 * power_setpoint / (ocv + math.sqrt(ocv**2 + 4 * rint * power_setpoint))
 
     def calculate_max_currents(
         self, state: BatteryState, dt: float, ocv: float, hys: float, rint: float, Q: float
@@ -236,6 +263,9 @@ class Battery:
         (current that would drive SOC to the configured ``soc_limits``
         this step).
 
+        With ``rint == 0`` the terminal voltage equals ``ocv + hys`` for any
+        current, so the voltage limit is unbounded (``±inf``).
+
         Args:
             state: Current battery state (reads ``soc``).
             dt: Timestep in seconds.
@@ -251,99 +281,100 @@ class Battery:
         (soc_min, soc_max) = self.soc_limits
         soc = state.soc
 
+        # shared by both bounds: hoist the divisions out of the limit expressions
+        i_per_soc = Q * 3600 / dt  # current that moves the SOC by 1 p.u. within dt
+        if rint > 0.0:
+            inv_rint = 1.0 / rint
+            i_max_voltage_charge = (self._max_voltage - ocv - hys) * inv_rint
+            i_max_voltage_discharge = (self._min_voltage - ocv - hys) * inv_rint
+        else:  # without resistance the terminal voltage does not depend on the current
+            i_max_voltage_charge = math.inf
+            i_max_voltage_discharge = -math.inf
+
         # charge (all three values are positive; min = most restrictive)
         i_max_charge = min(
-            self.max_charge_current,  # C-rate limit
-            (self.max_voltage - ocv - hys) / rint,  # voltage limit
-            (soc_max - soc) * Q / (dt / 3600),  # SOC limit
+            self._max_charge_current,  # C-rate limit
+            i_max_voltage_charge,  # voltage limit
+            (soc_max - soc) * i_per_soc,  # SOC limit
         )
         # discharge (all three values are negative; max = least negative = most restrictive)
         i_max_discharge = max(
-            -self.max_discharge_current,  # C-rate limit
-            (self.min_voltage - ocv - hys) / rint,  # voltage limit
-            (soc_min - soc) * Q / (dt / 3600),  # SOC limit
+            -self._max_discharge_current,  # C-rate limit
+            i_max_voltage_discharge,  # voltage limit
+            (soc_min - soc) * i_per_soc,  # SOC limit
         )
         return i_max_charge, i_max_discharge
 
+    @property
+    def cell(self) -> CellType:
+        """Cell model of the battery system (read-only)."""
+        return self._cell
+
+    @property
+    def circuit(self) -> tuple[int, int]:
+        """Series-parallel configuration ``(s, p)`` of the battery system (read-only)."""
+        return self._circuit
+
     ## electrical properties
     def open_circuit_voltage(self, state: BatteryState) -> float:
         """Return the system-level open-circuit voltage in V."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.open_circuit_voltage(state) * serial
+        return self.cell.open_circuit_voltage(state) * self._serial
 
     def hysteresis_voltage(self, state: BatteryState) -> float:
         """Return the system-level hysteresis voltage in V."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.hysteresis_voltage(state) * serial
+        return self.cell.hysteresis_voltage(state) * self._serial
 
     def internal_resistance(self, state: BatteryState) -> float:
         """Return the system-level internal resistance in Ohms, scaled by SoH."""
-        (serial, parallel) = self.circuit
-
         # state.i = state.i / parallel # <- should be scaled to the cell
-        return self.cell.internal_resistance(state) / parallel * serial * state.soh_R
+        return self.cell.internal_resistance(state) / self._parallel * self._serial * state.soh_R
 
     def entropic_coefficient(self, state: BatteryState) -> float:
         """Return the system-level entropic coefficient in V/K."""
-        (serial, parallel) = self.circuit
-        return self.cell.entropic_coefficient(state) * serial
+        return self.cell.entropic_coefficient(state) * self._serial
 
     def capacity(self, state: BatteryState) -> float:
         """Return the current capacity in Ah, scaled by SoH."""
-        return self.nominal_capacity * state.soh_Q
+        return self._nominal_capacity * state.soh_Q
 
     def energy_capacity(self, state: BatteryState) -> float:
         """Return the current energy capacity in Wh, scaled by SoH."""
-        return self.nominal_energy_capacity * state.soh_Q
+        return self._nominal_energy_capacity * state.soh_Q
 
     @property
     def nominal_capacity(self) -> float:
         """Nominal capacity of the battery system in Ah."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.electrical.nominal_capacity * parallel
+        return self._nominal_capacity
 
     @property
     def nominal_voltage(self) -> float:
         """Nominal voltage of the battery system in V."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.electrical.nominal_voltage * serial
+        return self._nominal_voltage
 
     @property
     def nominal_energy_capacity(self) -> float:
         """Nominal energy capacity of the battery system in Wh."""
-        return self.nominal_capacity * self.nominal_voltage
+        return self._nominal_energy_capacity
 
     @property
     def min_voltage(self) -> float:
         """Minimum allowed voltage of the battery system in V."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.electrical.min_voltage * serial
+        return self._min_voltage
 
     @property
     def max_voltage(self) -> float:
         """Maximum allowed voltage of the battery system in V."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.electrical.max_voltage * serial
+        return self._max_voltage
 
     @property
     def max_charge_current(self) -> float:
         """Maximum allowed charge current in A."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.electrical.nominal_capacity * self.cell.electrical.max_charge_rate * parallel
+        return self._max_charge_current
 
     @property
     def max_discharge_current(self) -> float:
         """Maximum allowed discharge current in A."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.electrical.nominal_capacity * self.cell.electrical.max_discharge_rate * parallel
+        return self._max_discharge_current
 
     @property
     def coulomb_efficiency(self) -> float:
@@ -354,9 +385,7 @@ class Battery:
     @property
     def thermal_capacity(self) -> float:
         """Total thermal capacity of the battery system in J/K."""
-        (serial, parallel) = self.circuit
-
-        return self.cell.thermal.specific_heat * self.cell.thermal.mass * serial * parallel
+        return self._thermal_capacity
 
     @property
     def convection_coefficient(self) -> float:
@@ -387,6 +416,4 @@ class Battery:
         ``(serial × parallel)``. Used by :attr:`thermal_resistance` to compute
         the convective coupling between the pack and the thermal environment.
         """
-        (serial, parallel) = self.circuit
-
-        return self.cell.format.area * self.effective_cooling_area * serial * parallel
+        return self._surface_area * self.effective_cooling_area
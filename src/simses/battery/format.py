@@ -2,7 +2,7 @@ import math
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CellFormat:
     """Base class for cell geometries, providing volume and area."""
 
@@ -10,7 +10,7 @@ class CellFormat:
     area: float = field(init=False)  # in m²
 
 
-@dataclass
+@dataclass(slots=True)
 class PrismaticCell(CellFormat):
     """Prismatic cell format with height, width, and length in mm."""
 
@@ -24,10 +24,10 @@ class PrismaticCell(CellFormat):
         l = self.length
 
         self.volume = h * w * l * 1e-9  # m³
-        self.area = 2 * (l * h + l * w + w * h) * 1e-6  # m²
+        self.area = 2 * (l * (h + w) + w * h) * 1e-6  # m²
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundCell(CellFormat):
     """Cylindrical cell format with diameter and length in mm."""
 
@@ -37,11 +37,12 @@ class RoundCell(CellFormat):
     def __post_init__(self):
         d = self.diameter
         l = self.length
-        self.volume = math.pi * (d / 2) ** 2 * l * 1e-9  # m³
-        self.area = (math.pi * d * l + math.pi * (d / 2) ** 2) * 1e-6  # m²
+        r2 = 0.25 * d * d  # radius squared
+        self.volume = math.pi * r2 * l * 1e-9  # m³
+        self.area = math.pi * (d * l + r2) * 1e-6  # m²
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundCell18650(RoundCell):
     """Standard 18650 cylindrical cell (18 mm x 65 mm)."""
 
@@ -49,7 +50,7 @@ class RoundCell18650(RoundCell):
     length: float = 65  # mm
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundCell26650(RoundCell):
     """Standard 26650 cylindrical cell (26 mm x 65 mm)."""
 
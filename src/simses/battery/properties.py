@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricalCellProperties:
     """Electrical parameters of a single cell.
 
@@ -37,7 +37,7 @@ class ElectricalCellProperties:
     discharge_derate_voltage_start: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThermalCellProperties:
     """Thermal parameters of a single cell.
 
@@ -18,7 +18,7 @@ class ConverterLossModel(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ConverterState:
     """Mutable state of a :class:`Converter`.
 
@@ -87,7 +87,11 @@ class Converter:
             dt: Timestep in seconds.
         """
         max_power = self.max_power
-        power_ac = max(-max_power, min(power_setpoint, max_power))
+        power_ac = power_setpoint
+        if power_ac > max_power:
+            power_ac = max_power
+        elif power_ac < -max_power:
+            power_ac = -max_power
         power_dc = self.ac_to_dc(power_ac)
 
         self.storage.step(power_dc, dt)
@@ -95,7 +99,7 @@ class Converter:
 
         # check if subsystem fulfilled DC power
         # if not, re-calculate required AC power
-        if power_dc != 0 and (abs(power_dc - power_storage) / abs(power_dc)) > 0.01:  # 1% difference tolerance
+        if power_dc != 0 and abs(power_dc - power_storage) > 0.01 * abs(power_dc):  # 1% difference tolerance
             power_dc = power_storage
             power_ac = self.dc_to_ac(power_dc)
 
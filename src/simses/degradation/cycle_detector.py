@@ -7,7 +7,7 @@ class HalfCycle:
 
     Attributes:
         depth_of_discharge: Absolute SOC swing of the half-cycle in p.u.
-        mean_soc: Average SOC during the half-cycle in p.u.
+        mean_soc: Time-averaged SOC during the half-cycle in p.u.
         c_rate: Average C-rate during the half-cycle in 1/h.
         full_equivalent_cycles: FEC contribution (depth_of_discharge / 2).
     """
@@ -41,8 +41,7 @@ class HalfCycleDetector:
         self._prev_soc: float = initial_soc
         self._direction: int = 0  # +1 charging, -1 discharging, 0 unknown
         self._elapsed_time: float = 0.0  # seconds
-        self._soc_sum: float = 0.0  # for mean SOC calculation
-        self._soc_samples: int = 0
+        self._soc_time: float = 0.0  # time integral of SOC (p.u. * s), for mean SOC
         self.total_fec: float = 0.0
         self.last_cycle: HalfCycle | None = None
 
@@ -68,16 +67,14 @@ class HalfCycleDetector:
             # First movement — establish direction
             self._direction = new_direction
             self._elapsed_time += dt
-            self._soc_sum += (self._prev_soc + soc) / 2
-            self._soc_samples += 1
+            self._soc_time += (self._prev_soc + soc) * 0.5 * dt
             self._prev_soc = soc
             return False
 
         if new_direction == self._direction:
             # Same direction — accumulate
             self._elapsed_time += dt
-            self._soc_sum += (self._prev_soc + soc) / 2
-            self._soc_samples += 1
+            self._soc_time += (self._prev_soc + soc) * 0.5 * dt
             self._prev_soc = soc
             return False
 
@@ -90,15 +87,14 @@ class HalfCycleDetector:
         self._start_soc = self._prev_soc
         self._direction = new_direction
         self._elapsed_time = dt
-        self._soc_sum = (self._prev_soc + soc) / 2
-        self._soc_samples = 1
+        self._soc_time = (self._prev_soc + soc) * 0.5 * dt
         self._prev_soc = soc
         return True
 
     def _make_half_cycle(self) -> HalfCycle:
         """Build a HalfCycle from the accumulated data."""
         dod = abs(self._prev_soc - self._start_soc)
-        mean_soc = self._soc_sum / self._soc_samples if self._soc_samples > 0 else self._start_soc
+        mean_soc = self._soc_time / self._elapsed_time if self._elapsed_time > 0 else self._start_soc
         elapsed_hours = self._elapsed_time / 3600.0
         c_rate = dod / elapsed_hours if elapsed_hours > 0 else 0.0
         fec = dod / 2.0
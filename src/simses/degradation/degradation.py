@@ -84,20 +84,22 @@ class DegradationModel:
         2. The cycle detector checks for SOC direction reversals; when a
            half-cycle completes, cyclic aging is applied.
         """
+        deg = self.state  # accumulated degradation, updated in place
+
         # Calendar aging
-        dq_cal = self.calendar.update_capacity(state, dt, self.state.qloss_cal)
+        dq_cal = self.calendar.update_capacity(state, dt, deg.qloss_cal)
         dr_cal = self.calendar.update_resistance(state, dt)
-        self.state.qloss_cal += dq_cal
-        self.state.rinc_cal += dr_cal
+        deg.qloss_cal += dq_cal
+        deg.rinc_cal += dr_cal
         state.soh_Q -= dq_cal
         state.soh_R += dr_cal
 
         # Cycle detection + cyclic aging
         if self.cycle_detector.step(state.soc, dt):
             half_cycle = self.cycle_detector.last_cycle
-            dq_cyc = self.cyclic.update_capacity(state, half_cycle, self.state.qloss_cyc)
+            dq_cyc = self.cyclic.update_capacity(state, half_cycle, deg.qloss_cyc)
             dr_cyc = self.cyclic.update_resistance(state, half_cycle)
-            self.state.qloss_cyc += dq_cyc
-            self.state.rinc_cyc += dr_cyc
+            deg.qloss_cyc += dq_cyc
+            deg.rinc_cyc += dr_cyc
             state.soh_Q -= dq_cyc
             state.soh_R += dr_cyc
@@ -10,10 +10,10 @@ the numpy/scipy implementations dominates the actual interpolation math:
 * ``RegularGridInterpolator.__call__`` runs ~80 us of input sanitisation per
   scalar call before doing any work.
 
-The helpers below operate on plain Python lists and use ``bisect`` for the
-index search, which is the fastest scalar path on CPython. Models should
-convert their lookup-table arrays to lists once at construction time and pass
-those lists in on every call.
+The helpers below operate on plain Python sequences (lists or tuples) and use
+``bisect`` for the index search, which is the fastest scalar path on CPython.
+Models should convert their lookup-table arrays to lists or tuples once at
+construction time and pass those in on every call.
 
 Both helpers **raise on out-of-bounds inputs** rather than clipping. Silent
 clipping in physical models is dangerous: it masks integration overshoot,
@@ -22,15 +22,16 @@ the violation as a ``ValueError`` makes those bugs immediately diagnosable.
 """
 
 import bisect
+from collections.abc import Sequence
 
 
-def interp1d_scalar(x: float, xp: list[float], fp: list[float]) -> float:
+def interp1d_scalar(x: float, xp: Sequence[float], fp: Sequence[float]) -> float:
     """Linear interpolation of a scalar against a sorted axis.
 
     Args:
         x:  Query value.
-        xp: Strictly ascending axis (Python list).
-        fp: Function values at ``xp`` (Python list, same length).
+        xp: Strictly ascending axis (Python list or tuple).
+        fp: Function values at ``xp`` (Python list or tuple, same length).
 
     Returns:
         ``f(x)`` by linear interpolation.
@@ -50,9 +51,9 @@ def interp1d_scalar(x: float, xp: list[float], fp: list[float]) -> float:
 def interp2d_scalar(
     x: float,
     y: float,
-    xp: list[float],
-    yp: list[float],
-    mat: list[list[float]],
+    xp: Sequence[float],
+    yp: Sequence[float],
+    mat: Sequence[Sequence[float]],
 ) -> float:
     """Bilinear interpolation of a scalar (x, y) against a 2-D LUT.
 
@@ -1,11 +1,37 @@
+import functools
 import os
 
 import numpy as np
-import pandas as pd
 
 from simses.interpolation import interp1d_scalar
 
 
+@functools.cache
+def _sinamics_s120_lut(use_discharging_curve: bool) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Build the normalised (input, output) look-up table of :class:`SinamicsS120`.
+
+    Cached so that the CSV is parsed once per curve selection and the
+    read-only tables are shared between all converter instances.
+    """
+    path = os.path.dirname(os.path.abspath(__file__))
+    file = os.path.join(path, "data", "sinamics_S120_efficiency.csv")
+    eff = np.loadtxt(file, delimiter=",", skiprows=1)  # columns: Charging, Discharging
+
+    eff_ch = eff[::10, 0]  # every 10th row of the 1001-row table
+    eff_dch = eff[::10, 1] if use_discharging_curve else eff_ch
+
+    input_ch = np.linspace(0, 1, 101)
+    output_ch = input_ch * eff_ch
+
+    input_dch = np.linspace(0, 1, 101)
+    with np.errstate(invalid="ignore"):  # 0 / 0 at 0 p.u.; that point is replaced by an explicit 0 below
+        output_dch = input_dch / eff_dch
+
+    inp = np.hstack((-input_dch[1:][::-1], 0, input_ch[1:]))
+    out = np.hstack((-output_dch[1:][::-1], 0, output_ch[1:]))
+    return tuple(inp.tolist()), tuple(out.tolist())
+
+
 class SinamicsS120:
     """Siemens Sinamics S120 converter loss model from measured efficiency curves.
 
@@ -33,21 +59,7 @@ class SinamicsS120:
                 power. Set to ``True`` to preserve the measured
                 charge/discharge asymmetry.
         """
-        path = os.path.dirname(os.path.abspath(__file__))
-        file = os.path.join(path, "data", "sinamics_S120_efficiency.csv")
-        df_eff = pd.read_csv(file)  # efficiency curves
-
-        eff_ch = df_eff["Charging"][::10]  # every 10th row of the 1001-row table
-        eff_dch = df_eff["Discharging"][::10] if use_discharging_curve else eff_ch
-
-        input_ch = np.linspace(0, 1, 101)
-        output_ch = input_ch * eff_ch
-
-        input_dch = np.linspace(0, 1, 101)
-        output_dch = input_dch / eff_dch
-
-        self._inp = np.hstack((-input_dch[1:][::-1], 0, input_ch[1:])).tolist()
-        self._out = np.hstack((-output_dch[1:][::-1], 0, output_ch[1:])).tolist()
+        self._inp, self._out = _sinamics_s120_lut(use_discharging_curve)
 
     def ac_to_dc(self, power_ac: float) -> float:
         return interp1d_scalar(power_ac, self._inp, self._out)
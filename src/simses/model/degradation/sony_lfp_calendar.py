@@ -26,6 +26,11 @@ EA_RINC = 71827.0
 C_RINC = -3.3903
 D_RINC = 1.5604
 
+# Arrhenius terms folded once at import (the model is evaluated every timestep)
+_INV_T_REF_K = 1.0 / (T_REF + 273.15)
+_EA_R_QLOSS = -EA_QLOSS / R
+_EA_R_RINC = -EA_RINC / R
+
 
 class SonyLFPCalendarDegradation(CalendarDegradation):
     """Calendar aging for Sony/Murata LFP cells (Naumann 2018).
@@ -43,8 +48,7 @@ class SonyLFPCalendarDegradation(CalendarDegradation):
             return 0.0
 
         T_K = state.T + 273.15
-        T_REF_K = T_REF + 273.15
-        k_T_q = K_REF_QLOSS * math.exp(-EA_QLOSS / R * (1.0 / T_K - 1.0 / T_REF_K))
+        k_T_q = K_REF_QLOSS * math.exp(_EA_R_QLOSS * (1.0 / T_K - _INV_T_REF_K))
         k_soc_q = C_QLOSS * (state.soc - 0.5) ** 3 + D_QLOSS
         stress_q = k_T_q * k_soc_q
 
@@ -61,7 +65,6 @@ class SonyLFPCalendarDegradation(CalendarDegradation):
             return 0.0
 
         T_K = state.T + 273.15
-        T_REF_K = T_REF + 273.15
-        k_T_r = K_REF_RINC * math.exp(-EA_RINC / R * (1.0 / T_K - 1.0 / T_REF_K))
+        k_T_r = K_REF_RINC * math.exp(_EA_R_RINC * (1.0 / T_K - _INV_T_REF_K))
         k_soc_r = C_RINC * (state.soc - 0.5) ** 2 + D_RINC
         return k_T_r * k_soc_r * dt
@@ -1,9 +1,10 @@
+import math
 from dataclasses import dataclass
 
 from simses.thermal.protocol import ThermalComponent
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbientThermalState:
     """Mutable state of a :class:`AmbientThermalModel`.
 
@@ -21,10 +22,22 @@ class AmbientThermalModel:
     environment. Each component is an independent thermal node with its own
     temperature, thermal capacity, and thermal resistance.
 
-    Per-component ODE (forward Euler integration)::
+    Per-component ODE::
 
         dT_i / dt = Q_heat_i / C_th_i + (T_ambient - T_i) / (R_th_i * C_th_i)
 
+    The ODE is linear, so each step applies its exact solution for heat and
+    ambient temperature held constant over ``dt``::
+
+        T_ss_i = T_ambient + Q_heat_i * R_th_i
+        T_i   <- T_ss_i + (T_i - T_ss_i) * exp(-dt / (R_th_i * C_th_i))
+
+    Unlike forward Euler, this is stable for any ``dt`` and never overshoots
+    the steady-state temperature ``T_ss_i``.
+
+    An adiabatic component (``R_th_i = inf``) has no steady state; its
+    temperature rises by ``Q_heat_i * dt / C_th_i``.
+
     Components are registered via :meth:`add_component` and must provide:
 
     * ``state.T``             -- current temperature in °C (read/written)
@@ -60,15 +73,17 @@ class AmbientThermalModel:
         Args:
             dt: Timestep in seconds.
         """
-        T_amb = self.T_ambient
+        T_amb = self.state.T_ambient
         for comp in self._components:
-            T = comp.state.T
-            C_th = comp.thermal_capacity
+            state = comp.state
             R_th = comp.thermal_resistance
-            Q_loss = comp.state.heat
 
-            dT_dt = Q_loss / C_th + (T_amb - T) / (R_th * C_th)
-            comp.state.T = T + dT_dt * dt
+            if math.isinf(R_th):  # adiabatic node: no steady state, heat accumulates linearly
+                state.T += state.heat * dt / comp.thermal_capacity
+                continue
+
+            T_ss = T_amb + state.heat * R_th  # steady-state temperature for the current heat
+            state.T = T_ss + (state.T - T_ss) * math.exp(-dt / (R_th * comp.thermal_capacity))
 
     @property
     def T_ambient(self) -> float:
@@ -71,7 +71,7 @@ class ContainerProperties:
         self.V_internal = self.length * self.width * self.height * self.vol_air
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerThermalState:
     """Mutable state of a :class:`ContainerThermalModel`.
 
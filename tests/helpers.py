@@ -0,0 +1,26 @@
+"""Test helpers shared by several test modules (not collected by pytest)."""
+
+from simses.battery.state import BatteryState
+
+
+def _make_state(soc: float = 0.5, T: float = 25.0, is_charge: bool = True) -> BatteryState:
+    """Return a fresh cell-level BatteryState; tests mutate it, so never share instances."""
+    return BatteryState(
+        v=3.6,
+        i=0,
+        T=T,
+        power=0,
+        power_setpoint=0,
+        loss=0,
+        heat=0,
+        soc=soc,
+        ocv=3.6,
+        hys=0,
+        entropy=0,
+        is_charge=is_charge,
+        rint=0.001,
+        soh_Q=1.0,
+        soh_R=1.0,
+        i_max_charge=0,
+        i_max_discharge=0,
+    )
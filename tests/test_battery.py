@@ -83,6 +83,12 @@ class TestBatteryInitialization:
         expected_ocv = 3.0 + 0.5 * (4.2 - 3.0)  # 3.6
         assert bat.state.ocv == pytest.approx(expected_ocv)
 
+    def test_initial_voltage_includes_hysteresis(self):
+        """At rest the terminal voltage is ocv + hys, the same as after a zero-power step."""
+        bat = Battery(SonyLFP(), circuit=(1, 1), initial_states={"start_soc": 0.5, "start_T": 25.0})
+        assert bat.state.hys != 0.0
+        assert bat.state.v == pytest.approx(bat.state.ocv + bat.state.hys)
+
     def test_initial_rint(self):
         bat = _make_battery(soc=0.5)
         assert bat.state.rint == pytest.approx(SimpleCell.RINT)
@@ -130,6 +136,14 @@ class TestBatteryProperties:
         bat = _make_battery(circuit=(1, 2))
         assert bat.max_discharge_current == pytest.approx(1.0 * 100.0 * 2)
 
+    def test_circuit_is_read_only(self):
+        """The scaled limits are cached, so the circuit cannot be swapped afterwards."""
+        bat = _make_battery(circuit=(1, 2))
+        with pytest.raises(AttributeError):
+            bat.circuit = (1, 4)
+        assert bat.circuit == (1, 2)
+        assert bat.max_charge_current == pytest.approx(1.0 * 100.0 * 2)
+
     def test_max_charge_current_uses_charge_rate(self):
         """max_charge_current must use max_charge_rate, not max_discharge_rate."""
         bat = _make_battery(circuit=(1, 1), max_charge_rate=2.0, max_discharge_rate=0.5)
@@ -180,6 +194,16 @@ class TestBatteryProperties:
         bat_half = _make_battery(circuit=(1, 1), effective_cooling_area=0.5)
         assert bat_half.thermal_resistance == pytest.approx(bat_full.thermal_resistance * 2)
 
+    def test_thermal_properties_scale_with_same_circuit(self):
+        """thermal_capacity and area both scale with s * p, so R_th * C_th does not depend on the circuit."""
+        bat_cell = _make_battery(circuit=(1, 1))
+        bat_pack = _make_battery(circuit=(4, 3))
+        assert bat_pack.thermal_capacity == pytest.approx(bat_cell.thermal_capacity * 12)
+        assert bat_pack.area == pytest.approx(bat_cell.area * 12)
+        assert bat_pack.thermal_resistance * bat_pack.thermal_capacity == pytest.approx(
+            bat_cell.thermal_resistance * bat_cell.thermal_capacity
+        )
+
 
 # ===================================================================
 # Equilibrium current calculation (raw quadratic solver only)
@@ -217,6 +241,20 @@ class TestEquilibriumCurrent:
             v = ocv + hys + rint * i
             assert v * i == pytest.approx(p_set, rel=1e-6)
 
+    def test_zero_resistance_is_linear(self):
+        """With rint == 0 the quadratic degenerates to p = i * (ocv + hys)."""
+        bat = _make_battery(soc=0.5)
+        ocv, hys, _ = self._params(bat)
+        assert bat.equilibrium_current(100.0, ocv, hys, 0.0) == pytest.approx(100.0 / (ocv + hys))
+
+    def test_small_resistance_keeps_precision(self):
+        """The root must not lose precision to cancellation when rint * p << ocv**2."""
+        bat = _make_battery(soc=0.5)
+        ocv, hys, _ = self._params(bat)
+        rint = 1e-12
+        i = bat.equilibrium_current(1.0, ocv, hys, rint)
+        assert i * (ocv + hys + rint * i) == pytest.approx(1.0, rel=1e-12)
+
     def test_no_limiting_applied(self):
         """equilibrium_current does not clamp — very high power gives current above C-rate."""
         bat = _make_battery(soc=0.5)
@@ -799,6 +837,23 @@ class TestEdgeCases:
         assert bat.capacity(bat.state) == pytest.approx(100.0 * 0.8)
         assert bat.internal_resistance(bat.state) == pytest.approx(SimpleCell.RINT * 1.2)
 
+    def test_zero_resistance_step(self):
+        """rint == 0: step delivers p / ocv, limited by C-rate and SOC only (no voltage bound)."""
+
+        class _IdealCell(SimpleCell):
+            RINT = 0.0
+
+        bat = Battery(cell=_IdealCell(), circuit=(1, 1), initial_states={"start_soc": 0.5, "start_T": 25.0})
+        bat.step(power_setpoint=100.0, dt=60.0)
+        assert bat.state.i == pytest.approx(100.0 / 3.6)
+        assert bat.state.v == pytest.approx(3.6)
+        assert bat.state.loss == 0.0
+        assert bat.state.i_max_charge == pytest.approx(100.0)  # 1 C
+        assert bat.state.i_max_discharge == pytest.approx(-100.0)
+
+        bat.step(power_setpoint=-1e6, dt=60.0)
+        assert bat.state.i == pytest.approx(-100.0)  # curtailed to 1 C
+
 
 # ===================================================================
 # Default degradation model (degradation=True)
@@ -11,9 +11,9 @@ from dataclasses import dataclass
 import pytest
 
 from simses.battery.cell import CellType
-from simses.battery.state import BatteryState
 from simses.model.cell.samsung94Ah_nmc import Samsung94AhNMC
 from simses.model.cell.sony_lfp import SonyLFP
+from tests.helpers import _make_state
 
 
 # ---------------------------------------------------------------------------
@@ -66,28 +66,6 @@ def cell(spec) -> CellType:
     return spec.factory()
 
 
-def _state(soc: float = 0.5, T: float = 25.0, is_charge: bool = True) -> BatteryState:
-    return BatteryState(
-        v=0,
-        i=0,
-        T=T,
-        power=0,
-        power_setpoint=0,
-        loss=0,
-        heat=0,
-        soc=soc,
-        ocv=0,
-        hys=0,
-        entropy=0,
-        rint=0,
-        soh_Q=1.0,
-        soh_R=1.0,
-        is_charge=is_charge,
-        i_max_charge=0,
-        i_max_discharge=0,
-    )
-
-
 # ===================================================================
 # OCV curve
 # ===================================================================
@@ -95,7 +73,7 @@ class TestOCV:
     def test_monotonically_increasing(self, cell):
         """OCV must not decrease as SOC increases."""
         socs = [i / 100 for i in range(101)]
-        ocvs = [cell.open_circuit_voltage(_state(soc=s)) for s in socs]
+        ocvs = [cell.open_circuit_voltage(_make_state(soc=s)) for s in socs]
         for k in range(1, len(ocvs)):
             assert ocvs[k] >= ocvs[k - 1] - 1e-6, f"OCV decreased from SOC={socs[k - 1]} to SOC={socs[k]}"
 
@@ -105,7 +83,7 @@ class TestOCV:
         v_max = cell.electrical.max_voltage
         for soc_pct in range(0, 101, 10):
             soc = soc_pct / 100
-            ocv = cell.open_circuit_voltage(_state(soc=soc))
+            ocv = cell.open_circuit_voltage(_make_state(soc=soc))
             assert v_min <= ocv <= v_max, f"OCV={ocv:.4f} outside [{v_min}, {v_max}] at SOC={soc}"
 
 
@@ -140,7 +118,7 @@ class TestInternalResistance:
         for soc in socs:
             for T in temps:
                 for is_charge in modes:
-                    state = _state(soc=soc, T=T, is_charge=is_charge)
+                    state = _make_state(soc=soc, T=T, is_charge=is_charge)
                     rint = cell.internal_resistance(state)
                     assert rint > 0, f"Rint={rint} at SOC={soc}, T={T}, is_charge={is_charge}"
 
@@ -150,13 +128,13 @@ class TestInternalResistance:
 # ===================================================================
 class TestHysteresisVoltage:
     def test_returns_float(self, cell):
-        assert isinstance(cell.hysteresis_voltage(_state()), float)
+        assert isinstance(cell.hysteresis_voltage(_make_state()), float)
 
     def test_within_reasonable_range(self, cell):
         """Hysteresis voltage magnitude should be smaller than the full voltage window."""
         v_range = cell.electrical.max_voltage - cell.electrical.min_voltage
         for soc in [0.0, 0.25, 0.5, 0.75, 1.0]:
-            hys = cell.hysteresis_voltage(_state(soc=soc))
+            hys = cell.hysteresis_voltage(_make_state(soc=soc))
             assert abs(hys) < v_range, f"Hysteresis={hys:.4f} exceeds voltage window at SOC={soc}"
 
 
@@ -165,12 +143,12 @@ class TestHysteresisVoltage:
 # ===================================================================
 class TestEntropicCoefficient:
     def test_returns_float(self, cell):
-        assert isinstance(cell.entropic_coefficient(_state()), float)
+        assert isinstance(cell.entropic_coefficient(_make_state()), float)
 
     def test_reasonable_magnitude(self, cell):
         """Entropic coefficient for Li-ion cells is typically between -1 and +1 mV/K."""
         for soc in [0.0, 0.25, 0.5, 0.75, 1.0]:
-            ec = cell.entropic_coefficient(_state(soc=soc))
+            ec = cell.entropic_coefficient(_make_state(soc=soc))
             assert abs(ec) < 1e-2, f"Entropic coefficient={ec:.6f} V/K seems unreasonably large at SOC={soc}"
 
 
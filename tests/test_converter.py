@@ -196,18 +196,15 @@ class TestConverterLoss:
 # Edge cases
 # ===================================================================
 class TestConverterEdgeCases:
-    def test_very_small_power(self):
-        """Very small power should be handled correctly."""
+    @pytest.mark.parametrize(
+        ("power_setpoint", "rel"),
+        [(0.001, 1e-2), (1000.0, 1e-6)],
+        ids=["very_small_power", "max_power_exactly"],
+    )
+    def test_setpoint_delivered(self, power_setpoint, rel):
+        """Very small power and exactly max power should both be delivered."""
         conv = _make_converter(max_power=1000.0)
 
-        conv.step(power_setpoint=0.001, dt=1.0)
+        conv.step(power_setpoint=power_setpoint, dt=1.0)
 
-        assert conv.state.power == pytest.approx(0.001, rel=1e-2)
-
-    def test_max_power_exactly(self):
-        """Requesting exactly max power should work."""
-        conv = _make_converter(max_power=1000.0)
-
-        conv.step(power_setpoint=1000.0, dt=1.0)
-
-        assert conv.state.power == pytest.approx(1000.0)
+        assert conv.state.power == pytest.approx(power_setpoint, rel=rel)
@@ -8,6 +8,7 @@ losses, …) are run automatically for every entry.
 
 from dataclasses import dataclass
 
+import numpy as np
 import pytest
 
 from simses.model.converter.bonfiglioli import BonfiglioliTL4Q, BonfiglioliTL4QFieldData
@@ -76,14 +77,14 @@ CONVERTER_SPECS: list[ConverterModelSpec] = [
 # ---------------------------------------------------------------------------
 # Shared fixtures
 # ---------------------------------------------------------------------------
-@pytest.fixture(params=CONVERTER_SPECS, ids=lambda s: s.name)
+@pytest.fixture(scope="module", params=CONVERTER_SPECS, ids=lambda s: s.name)
 def spec(request) -> ConverterModelSpec:
     return request.param
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def model(spec):
-    """Create a loss model instance from the spec."""
+    """Create a loss model instance from the spec (shared: loss models are stateless)."""
     return spec.factory()
 
 
@@ -123,22 +124,14 @@ class TestLossModel:
     def test_monotonic_charge(self, model):
         """Higher AC input should give higher DC output."""
         powers_ac = [0.0, 0.2, 0.5, 0.8, 1.0]
-        powers_dc = [model.ac_to_dc(p) for p in powers_ac]
-        for i in range(len(powers_dc) - 1):
-            assert powers_dc[i + 1] >= powers_dc[i], (
-                f"DC output decreased from AC={powers_ac[i]} to AC={powers_ac[i + 1]} "
-                f"(DC: {powers_dc[i]} -> {powers_dc[i + 1]})"
-            )
+        powers_dc = np.array([model.ac_to_dc(p) for p in powers_ac])
+        assert np.all(np.diff(powers_dc) >= 0), f"DC output not monotonic in AC input {powers_ac}: {powers_dc}"
 
     def test_monotonic_discharge(self, model):
-        """Higher DC input should give higher AC output."""
+        """More negative AC input should give more negative DC output."""
         powers_ac = [-0.0, -0.2, -0.5, -0.8, -1.0]
-        powers_dc = [model.ac_to_dc(p) for p in powers_ac]
-        for i in range(len(powers_ac) - 1):
-            assert powers_ac[i + 1] <= powers_ac[i], (
-                f"AC output decreased from DC={powers_dc[i]} to DC={powers_dc[i + 1]} "
-                f"(AC: {powers_ac[i]} -> {powers_ac[i + 1]})"
-            )
+        powers_dc = np.array([model.ac_to_dc(p) for p in powers_ac])
+        assert np.all(np.diff(powers_dc) <= 0), f"DC output not monotonic in AC input {powers_ac}: {powers_dc}"
 
     def test_efficiency_reasonable(self, model):
         """Efficiency should be between 0 and 1."""
@@ -59,6 +59,14 @@ class TestStressFactors:
         det.step(0.55, dt=60.0)  # reversal
         assert det.last_cycle.mean_soc == pytest.approx(0.5)
 
+    def test_mean_soc_is_time_weighted(self):
+        """Longer timesteps should weigh more in the mean SOC."""
+        det = HalfCycleDetector(initial_soc=0.0)
+        det.step(0.5, dt=100.0)  # midpoint 0.25 for 100 s
+        det.step(1.0, dt=300.0)  # midpoint 0.75 for 300 s
+        det.step(0.9, dt=60.0)  # reversal
+        assert det.last_cycle.mean_soc == pytest.approx((0.25 * 100 + 0.75 * 300) / 400)
+
     def test_c_rate_units(self):
         """C-rate should be DOD / elapsed_hours (1/h)."""
         det = HalfCycleDetector(initial_soc=0.5)
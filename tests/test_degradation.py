@@ -6,6 +6,7 @@ from simses.degradation.calendar import CalendarDegradation
 from simses.degradation.cycle_detector import HalfCycle
 from simses.degradation.cyclic import CyclicDegradation
 from simses.degradation.degradation import DegradationModel
+from tests.helpers import _make_state
 
 # Reuse test helpers from test_battery
 from tests.test_battery import SimpleCell, _make_battery
@@ -56,25 +57,7 @@ class TestDegradationModel:
         cyc = MockCyclic()
         model = DegradationModel(calendar=cal, cyclic=cyc, initial_soc=0.5)
 
-        state = BatteryState(
-            v=3.6,
-            i=0,
-            T=25.0,
-            power=0,
-            power_setpoint=0,
-            loss=0,
-            heat=0,
-            soc=0.5,
-            ocv=3.6,
-            hys=0,
-            entropy=0,
-            is_charge=True,
-            rint=0.001,
-            soh_Q=1.0,
-            soh_R=1.0,
-            i_max_charge=0,
-            i_max_discharge=0,
-        )
+        state = _make_state()
         for _ in range(5):
             model.step(state, dt=60.0)
 
@@ -86,25 +69,7 @@ class TestDegradationModel:
         cyc = MockCyclic()
         model = DegradationModel(calendar=cal, cyclic=cyc, initial_soc=0.5)
 
-        state = BatteryState(
-            v=3.6,
-            i=0,
-            T=25.0,
-            power=0,
-            power_setpoint=0,
-            loss=0,
-            heat=0,
-            soc=0.5,
-            ocv=3.6,
-            hys=0,
-            entropy=0,
-            is_charge=True,
-            rint=0.001,
-            soh_Q=1.0,
-            soh_R=1.0,
-            i_max_charge=0,
-            i_max_discharge=0,
-        )
+        state = _make_state()
 
         # Monotonic charge — no cycle
         state.soc = 0.6
@@ -123,25 +88,7 @@ class TestDegradationModel:
         cal = MockCalendar(dq=1e-4, dr=0.0)
         model = DegradationModel.calendar_only(calendar=cal, initial_soc=0.5)
 
-        state = BatteryState(
-            v=3.6,
-            i=0,
-            T=25.0,
-            power=0,
-            power_setpoint=0,
-            loss=0,
-            heat=0,
-            soc=0.5,
-            ocv=3.6,
-            hys=0,
-            entropy=0,
-            is_charge=True,
-            rint=0.001,
-            soh_Q=1.0,
-            soh_R=1.0,
-            i_max_charge=0,
-            i_max_discharge=0,
-        )
+        state = _make_state()
         for _ in range(10):
             model.step(state, dt=60.0)
 
@@ -152,25 +99,7 @@ class TestDegradationModel:
         cal = MockCalendar(dq=0.0, dr=1e-4)
         model = DegradationModel.calendar_only(calendar=cal, initial_soc=0.5)
 
-        state = BatteryState(
-            v=3.6,
-            i=0,
-            T=25.0,
-            power=0,
-            power_setpoint=0,
-            loss=0,
-            heat=0,
-            soc=0.5,
-            ocv=3.6,
-            hys=0,
-            entropy=0,
-            is_charge=True,
-            rint=0.001,
-            soh_Q=1.0,
-            soh_R=1.0,
-            i_max_charge=0,
-            i_max_discharge=0,
-        )
+        state = _make_state()
         for _ in range(10):
             model.step(state, dt=60.0)
 
@@ -181,25 +110,7 @@ class TestDegradationModel:
         cal = MockCalendar()
         model = DegradationModel.calendar_only(calendar=cal, initial_soc=0.5)
 
-        state = BatteryState(
-            v=3.6,
-            i=0,
-            T=25.0,
-            power=0,
-            power_setpoint=0,
-            loss=0,
-            heat=0,
-            soc=0.5,
-            ocv=3.6,
-            hys=0,
-            entropy=0,
-            is_charge=True,
-            rint=0.001,
-            soh_Q=1.0,
-            soh_R=1.0,
-            i_max_charge=0,
-            i_max_discharge=0,
-        )
+        state = _make_state()
         # Force a reversal
         state.soc = 0.6
         model.step(state, dt=60.0)
@@ -213,25 +124,7 @@ class TestDegradationModel:
         cyc = MockCyclic(dq=1e-3, dr=1e-3)
         model = DegradationModel.cyclic_only(cyclic=cyc, initial_soc=0.5)
 
-        state = BatteryState(
-            v=3.6,
-            i=0,
-            T=25.0,
-            power=0,
-            power_setpoint=0,
-            loss=0,
-            heat=0,
-            soc=0.5,
-            ocv=3.6,
-            hys=0,
-            entropy=0,
-            is_charge=True,
-            rint=0.001,
-            soh_Q=1.0,
-            soh_R=1.0,
-            i_max_charge=0,
-            i_max_discharge=0,
-        )
+        state = _make_state()
         # No reversal — no cyclic change, no calendar change
         state.soc = 0.6
         model.step(state, dt=60.0)
@@ -263,12 +156,13 @@ class TestBatteryDegradationIntegration:
             degradation=model,
         )
 
-        # Run several charge/discharge cycles
-        for _ in range(50):
+        # Charge then discharge: the first discharge step completes a half-cycle
+        for _ in range(2):
             bat.step(power_setpoint=200.0, dt=60.0)
-        for _ in range(50):
+        for _ in range(2):
             bat.step(power_setpoint=-200.0, dt=60.0)
 
+        assert cyc.call_count == 1
         assert bat.state.soh_Q < 1.0
         assert bat.state.soh_R > 1.0
 
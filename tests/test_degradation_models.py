@@ -9,37 +9,15 @@ from dataclasses import dataclass
 
 import pytest
 
-from simses.battery.state import BatteryState
 from simses.degradation.cycle_detector import HalfCycle
 from simses.model.degradation.sony_lfp_calendar import SonyLFPCalendarDegradation
 from simses.model.degradation.sony_lfp_cyclic import SonyLFPCyclicDegradation
+from tests.helpers import _make_state
 
 
 # ---------------------------------------------------------------------------
 # State helpers
 # ---------------------------------------------------------------------------
-def _make_state(soc: float = 0.5, T: float = 25.0) -> BatteryState:
-    return BatteryState(
-        v=3.6,
-        i=0,
-        T=T,
-        power=0,
-        power_setpoint=0,
-        loss=0,
-        heat=0,
-        soc=soc,
-        ocv=3.6,
-        hys=0,
-        entropy=0,
-        is_charge=True,
-        rint=0.001,
-        soh_Q=1.0,
-        soh_R=1.0,
-        i_max_charge=0,
-        i_max_discharge=0,
-    )
-
-
 def _make_half_cycle(dod: float = 0.5, mean_soc: float = 0.5, c_rate: float = 0.5) -> HalfCycle:
     return HalfCycle(
         depth_of_discharge=dod,
@@ -77,22 +55,22 @@ CYCLIC_SPECS = [
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
-@pytest.fixture(params=CALENDAR_SPECS, ids=lambda s: s.name)
+@pytest.fixture(scope="module", params=CALENDAR_SPECS, ids=lambda s: s.name)
 def cal_spec(request) -> CalendarModelSpec:
     return request.param
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def cal_model(cal_spec):
     return cal_spec.factory()
 
 
-@pytest.fixture(params=CYCLIC_SPECS, ids=lambda s: s.name)
+@pytest.fixture(scope="module", params=CYCLIC_SPECS, ids=lambda s: s.name)
 def cyc_spec(request) -> CyclicModelSpec:
     return request.param
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def cyc_model(cyc_spec):
     return cyc_spec.factory()
 
@@ -121,12 +99,9 @@ class TestCalendarModel:
 
     def test_longer_time_more_degradation(self, cal_model):
         """More time should produce more capacity loss."""
-        state1 = _make_state()
-        state2 = _make_state()
-        model1 = type(cal_model)()
-        model2 = type(cal_model)()
-        dq1 = model1.update_capacity(state1, dt=3600.0, accumulated_qloss=0.0)
-        dq2 = model2.update_capacity(state2, dt=36000.0, accumulated_qloss=0.0)
+        state = _make_state()
+        dq1 = cal_model.update_capacity(state, dt=3600.0, accumulated_qloss=0.0)
+        dq2 = cal_model.update_capacity(state, dt=36000.0, accumulated_qloss=0.0)
         assert dq2 > dq1  # more positive = more loss
 
 
@@ -160,34 +135,27 @@ class TestCyclicModel:
 # Sony LFP calendar specific tests
 # ===================================================================
 class TestSonyLFPCalendar:
-    def test_higher_temperature_more_aging(self):
-        """Higher temperature should accelerate calendar aging."""
-        model_cold = SonyLFPCalendarDegradation()
-        model_hot = SonyLFPCalendarDegradation()
-        state_cold = _make_state(T=5.0)  # 5 °C
-        state_hot = _make_state(T=45.0)  # 45 °C
-        dq_cold = model_cold.update_capacity(state_cold, dt=86400.0, accumulated_qloss=0.0)
-        dq_hot = model_hot.update_capacity(state_hot, dt=86400.0, accumulated_qloss=0.0)
-        assert dq_hot > dq_cold  # more positive = more degradation
-
-    def test_higher_temperature_more_rinc(self):
-        """Higher temperature should also increase resistance more."""
-        model_cold = SonyLFPCalendarDegradation()
-        model_hot = SonyLFPCalendarDegradation()
-        state_cold = _make_state(T=5.0)
-        state_hot = _make_state(T=45.0)
-        dr_cold = model_cold.update_resistance(state_cold, dt=86400.0)
-        dr_hot = model_hot.update_resistance(state_hot, dt=86400.0)
-        assert dr_hot > dr_cold
+    @pytest.mark.parametrize(
+        "update",
+        [
+            lambda model, state: model.update_capacity(state, dt=86400.0, accumulated_qloss=0.0),
+            lambda model, state: model.update_resistance(state, dt=86400.0),
+        ],
+        ids=["capacity", "resistance"],
+    )
+    def test_higher_temperature_more_aging(self, update):
+        """Higher temperature should accelerate capacity loss and resistance increase."""
+        model = SonyLFPCalendarDegradation()
+        cold = update(model, _make_state(T=5.0))  # 5 °C
+        hot = update(model, _make_state(T=45.0))  # 45 °C
+        assert hot > cold  # more positive = more degradation
 
     def test_sqrt_time_behavior(self):
         """Capacity loss should follow sqrt(t) — doubling time < 2x loss."""
-        model1 = SonyLFPCalendarDegradation()
-        model2 = SonyLFPCalendarDegradation()
-        state1 = _make_state()
-        state2 = _make_state()
-        dq1 = model1.update_capacity(state1, dt=86400.0, accumulated_qloss=0.0)
-        dq2 = model2.update_capacity(state2, dt=4 * 86400.0, accumulated_qloss=0.0)
+        model = SonyLFPCalendarDegradation()
+        state = _make_state()
+        dq1 = model.update_capacity(state, dt=86400.0, accumulated_qloss=0.0)
+        dq2 = model.update_capacity(state, dt=4 * 86400.0, accumulated_qloss=0.0)
         # sqrt(4) = 2, so 4x time should give ~2x loss
         ratio = dq2 / dq1
         assert ratio == pytest.approx(2.0, rel=0.01)
@@ -219,26 +187,19 @@ class TestSonyLFPCalendar:
 # Sony LFP cyclic specific tests
 # ===================================================================
 class TestSonyLFPCyclic:
-    def test_higher_dod_more_aging(self):
-        """Higher depth of discharge should cause more degradation."""
+    @pytest.mark.parametrize(
+        ("low", "high"),
+        [({"dod": 0.2}, {"dod": 0.8}), ({"c_rate": 0.2}, {"c_rate": 2.0})],
+        ids=["dod", "c_rate"],
+    )
+    def test_higher_stress_more_aging(self, low, high):
+        """Higher depth of discharge or C-rate should cause more degradation."""
         model = SonyLFPCyclicDegradation()
         state = _make_state()
-        hc_low = _make_half_cycle(dod=0.2)
-        hc_high = _make_half_cycle(dod=0.8)
-        dq_low = model.update_capacity(state, hc_low, accumulated_qloss=0.0)
-        dq_high = model.update_capacity(state, hc_high, accumulated_qloss=0.0)
+        dq_low = model.update_capacity(state, _make_half_cycle(**low), accumulated_qloss=0.0)
+        dq_high = model.update_capacity(state, _make_half_cycle(**high), accumulated_qloss=0.0)
         assert dq_high > dq_low  # more positive = more loss
 
-    def test_higher_crate_more_aging(self):
-        """Higher C-rate should cause more degradation."""
-        model = SonyLFPCyclicDegradation()
-        state = _make_state()
-        hc_low = _make_half_cycle(c_rate=0.2)
-        hc_high = _make_half_cycle(c_rate=2.0)
-        dq_low = model.update_capacity(state, hc_low, accumulated_qloss=0.0)
-        dq_high = model.update_capacity(state, hc_high, accumulated_qloss=0.0)
-        assert dq_high > dq_low
-
     def test_sqrt_fec_behavior(self):
         """Capacity loss should follow sqrt(FEC) — 4x FEC should give ~2x loss."""
         model = SonyLFPCyclicDegradation()
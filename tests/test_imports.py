@@ -0,0 +1,14 @@
+"""Tests for the package's import-time dependencies."""
+
+import subprocess
+import sys
+
+
+def test_simulation_modules_do_not_import_scipy():
+    """scipy is a test-only dependency — importing the models must not pull it in."""
+    code = (
+        "import sys, simses.battery, simses.converter, simses.degradation, simses.thermal, "
+        "simses.model.cell.sony_lfp, simses.model.converter.sinamics; "
+        "assert 'scipy' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,7 +1,9 @@
 """Unit and integration tests for the AmbientThermalModel."""
 
-from itertools import pairwise
+import math
+from dataclasses import dataclass
 
+import numpy as np
 import pytest
 
 from simses.thermal.ambient import AmbientThermalModel
@@ -11,12 +13,10 @@ from tests.test_battery import _make_battery
 # ---------------------------------------------------------------------------
 # Lightweight mock component (duck-typed to match the thermal model interface)
 # ---------------------------------------------------------------------------
+@dataclass(slots=True)
 class _MockState:
-    __slots__ = ("T", "heat")
-
-    def __init__(self, T: float, heat: float = 0.0):
-        self.T = T
-        self.heat = heat
+    T: float
+    heat: float = 0.0
 
 
 class _MockComponent:
@@ -48,8 +48,9 @@ class TestAmbientThermalModelUnit:
 
         model.step(dt=1.0)
 
-        # dT = (500 / 1000 + 0) * 1 = 0.5 °C
-        assert comp.state.T == pytest.approx(25.5)
+        # dT = Q * R * (1 - exp(-dt / (R * C))) ≈ 500 / 1000 * 1 = 0.5 °C
+        assert comp.state.T == pytest.approx(25.0 + 500.0 * (1 - math.exp(-1.0 / 1000.0)))
+        assert comp.state.T == pytest.approx(25.5, abs=1e-3)
 
     def test_cooling_toward_ambient(self):
         """Hot component with no loss cools toward ambient."""
@@ -58,10 +59,10 @@ class TestAmbientThermalModelUnit:
 
         model.step(dt=1.0)
 
-        # dT = (0 + (25.0 - 37.0) / (1 * 1000)) * 1 = -0.012 °C
+        # T = 25 + 12 * exp(-1 / 1000) ≈ 37.0 - 0.012 °C
         assert comp.state.T < 37.0
         assert comp.state.T > 25.0
-        assert comp.state.T == pytest.approx(37.0 - 12.0 / 1000)
+        assert comp.state.T == pytest.approx(25.0 + 12.0 * math.exp(-1.0 / 1000.0))
 
     def test_warming_toward_ambient(self):
         """Cold component with no loss warms toward ambient."""
@@ -84,10 +85,11 @@ class TestAmbientThermalModelUnit:
         comp = _MockComponent(T=T_amb, loss=Q_loss, thermal_capacity=C_th, thermal_resistance=R_th)
         model = AmbientThermalModel(T_ambient=T_amb, components=[comp])
 
-        for _ in range(100_000):
-            model.step(dt=1.0)
+        # the exact step composes: ten steps of 10 * R * C leave exp(-100) of the initial offset
+        for _ in range(10):
+            model.step(dt=10 * R_th * C_th)
 
-        assert comp.state.T == pytest.approx(T_expected, rel=1e-3)
+        assert comp.state.T == pytest.approx(T_expected)
 
     def test_multiple_components_independent(self):
         """Each component evolves independently with its own thermal properties."""
@@ -105,8 +107,8 @@ class TestAmbientThermalModelUnit:
         model = AmbientThermalModel(T_ambient=25.0)
         model.step(dt=1.0)  # should not raise
 
-    def test_exact_euler_step(self):
-        """Verify the forward Euler formula for one step."""
+    def test_exact_step(self):
+        """Verify the exact exponential solution for one step."""
         T_0 = 27.0
         Q = 200.0
         C = 800.0
@@ -114,8 +116,8 @@ class TestAmbientThermalModelUnit:
         T_amb = 22.0
         dt = 2.0
 
-        dT_dt = Q / C + (T_amb - T_0) / (R * C)
-        T_expected = T_0 + dT_dt * dt
+        T_ss = T_amb + Q * R
+        T_expected = T_ss + (T_0 - T_ss) * math.exp(-dt / (R * C))
 
         comp = _MockComponent(T=T_0, loss=Q, thermal_capacity=C, thermal_resistance=R)
         model = AmbientThermalModel(T_ambient=T_amb, components=[comp])
@@ -123,6 +125,27 @@ class TestAmbientThermalModelUnit:
 
         assert comp.state.T == pytest.approx(T_expected)
 
+    def test_large_step_does_not_overshoot(self):
+        """A step much longer than R * C lands on the steady state instead of diverging."""
+        comp = _MockComponent(T=25.0, loss=100.0, thermal_capacity=10.0, thermal_resistance=0.1)
+        model = AmbientThermalModel(T_ambient=25.0, components=[comp])
+
+        model.step(dt=3600.0)  # R * C = 1 s
+
+        assert comp.state.T == pytest.approx(25.0 + 100.0 * 0.1)
+
+    def test_adiabatic_component(self):
+        """Infinite thermal resistance: heat accumulates without exchange, no NaN."""
+        comp = _MockComponent(T=25.0, loss=10.0, thermal_capacity=100.0, thermal_resistance=math.inf)
+        model = AmbientThermalModel(T_ambient=25.0, components=[comp])
+
+        model.step(dt=1.0)
+        assert comp.state.T == pytest.approx(25.1)
+
+        comp.state.heat = 0.0
+        model.step(dt=1.0)
+        assert comp.state.T == pytest.approx(25.1)
+
     def test_constructor_and_add_component_are_equivalent(self):
         """Passing components via constructor or add_component gives the same result."""
         comp_a = _MockComponent(T=37.0, loss=100.0, thermal_capacity=1000.0, thermal_resistance=1.0)
@@ -191,7 +214,7 @@ class TestAmbientThermalModelWithBattery:
             temps.append(bat.state.T)
 
         # temperature should rise monotonically (losses always positive, starting at ambient)
-        assert all(t2 >= t1 - 1e-12 for t1, t2 in pairwise(temps))
+        assert np.all(np.diff(temps) >= -1e-12)
         assert temps[-1] > temps[0]
 
     def test_two_batteries_diverge(self):
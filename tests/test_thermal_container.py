@@ -12,24 +12,7 @@ from simses.thermal.container import (
     ThermostatStrategy,
 )
 from tests.test_battery import _make_battery
-
-
-# ---------------------------------------------------------------------------
-# Lightweight mock component (duck-typed to match the thermal model interface)
-# ---------------------------------------------------------------------------
-class _MockState:
-    __slots__ = ("T", "heat")
-
-    def __init__(self, T: float, heat: float = 0.0):
-        self.T = T
-        self.heat = heat
-
-
-class _MockComponent:
-    def __init__(self, T: float, loss: float, thermal_capacity: float, thermal_resistance: float):
-        self.state = _MockState(T=T, heat=loss)
-        self.thermal_capacity = thermal_capacity
-        self.thermal_resistance = thermal_resistance
+from tests.test_thermal_ambient import _MockComponent
 
 
 # ---------------------------------------------------------------------------